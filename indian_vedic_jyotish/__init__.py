@@ -1,5 +1,11 @@
 from .panchang import Panchang
 from .core import Ephemeris
 from .solar import SolarCalendar
+from . import core, solar
 
 __version__ = "0.1.0"
+
+def _cache_clear():
+    """Drop all memoized results (ephemeris, sunrise/sunset, Sankranti tables), e.g. after swe.set_sid_mode()."""
+    core._cache_clear()
+    solar._cache_clear()
@@ -1,10 +1,15 @@
 import swisseph as swe
 import pytz
-from datetime import datetime
-from .utils import normalize_degrees
+from datetime import datetime, timedelta
+from functools import lru_cache
 
 import os
 
+try:
+    import numpy as np
+except ImportError: # numpy is only needed for the batch (array) API
+    np = None
+
 # Set Ayanamsa to Lahiri (Chitra Paksha) - Standard for Indian Astrology
 swe.set_sid_mode(swe.SIDM_LAHIRI)
 
@@ -13,6 +18,85 @@ ephe_path = os.environ.get("SE_EPHE_PATH")
 if ephe_path:
     swe.set_ephe_path(ephe_path)
 
+# Flags for sidereal longitude with daily motion
+_SIDEREAL_FLAGS = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_SPEED
+_SIDEREAL_FLAGS_MOSEPH = swe.FLG_MOSEPH | swe.FLG_SIDEREAL | swe.FLG_SPEED
+
+def _jd_to_datetime(jd, tz=pytz.utc):
+    """Convert Julian Day (UT) to a datetime in tz, rounded to the nearest second."""
+    y, m, d, h_dec = swe.revjul(jd)
+    # Work in integer seconds so float error cannot produce second=60
+    dt = datetime(y, m, d, tzinfo=pytz.utc) + timedelta(seconds=round(h_dec * 3600))
+    return dt if tz is pytz.utc else dt.astimezone(tz)
+
+# Ephemeris results are memoized on JD rounded to ~1 ms. The sidereal mode is
+# set once at import, so cached values stay valid unless it is changed;
+# call indian_vedic_jyotish._cache_clear() after changing the ayanamsa.
+
+@lru_cache(maxsize=4096)
+def _planetary_positions(jd):
+    _calc = swe.calc_ut
+    try:
+        # 0 = swe.SUN, 1 = swe.MOON
+        sun = _calc(jd, 0, _SIDEREAL_FLAGS)
+        moon = _calc(jd, 1, _SIDEREAL_FLAGS)
+    except swe.Error:
+        # Fallback to Moshier Ephemeris if Swiss Ephemeris files are missing
+        sun = _calc(jd, 0, _SIDEREAL_FLAGS_MOSEPH)
+        moon = _calc(jd, 1, _SIDEREAL_FLAGS_MOSEPH)
+    
+    return sun[0][0], moon[0][0], sun[0][3], moon[0][3]
+
+@lru_cache(maxsize=4096)
+def _sun_longitude(jd):
+    try:
+        sun = swe.calc_ut(jd, 0, _SIDEREAL_FLAGS)
+    except swe.Error:
+        # Fallback to Moshier Ephemeris if Swiss Ephemeris files are missing
+        sun = swe.calc_ut(jd, 0, _SIDEREAL_FLAGS_MOSEPH)
+    
+    return sun[0][0], sun[0][3]
+
+@lru_cache(maxsize=1024)
+def _sunrise_sunset(date_ord, lat, lon):
+    geopos = (lon, lat, 0)
+    
+    def find_event(start_jd, rsmi):
+        try:
+            res, tret = swe.rise_trans(start_jd, swe.SUN, rsmi, geopos, flags=swe.FLG_SWIEPH)
+        except swe.Error:
+            # Fallback to Moshier
+            res, tret = swe.rise_trans(start_jd, swe.SUN, rsmi, geopos, flags=swe.FLG_MOSEPH)
+        # res is -2 if the Sun is circumpolar (no rise/set on this day)
+        return tret[0] if res == 0 else None
+
+    # Search from midnight at the observer's own longitude (local mean time),
+    # independent of the timezone of the input datetime
+    day = datetime.fromordinal(date_ord)
+    jd_mid = swe.julday(day.year, day.month, day.day, 0.0) - lon / 360.0
+    
+    # Default rsmi: upper limb of the Sun with standard refraction
+    rise_jd = find_event(jd_mid, swe.CALC_RISE)
+    # Sunset following that Sunrise, so the pair spans one daylight period
+    set_jd = find_event(rise_jd if rise_jd else jd_mid, swe.CALC_SET)
+    
+    sunrise_dt = _jd_to_datetime(rise_jd) if rise_jd else None
+    sunset_dt = _jd_to_datetime(set_jd) if set_jd else None
+    
+    return sunrise_dt, sunset_dt
+
+def _require_numpy():
+    """Return the numpy module, or raise ImportError for the batch API without it."""
+    if np is None:
+        raise ImportError("numpy is required for batch calculations: pip install indian_vedic_jyotish[batch]")
+    return np
+
+def _cache_clear():
+    """Drop this module's memoized results. Use indian_vedic_jyotish._cache_clear() to clear everything."""
+    _planetary_positions.cache_clear()
+    _sun_longitude.cache_clear()
+    _sunrise_sunset.cache_clear()
+
 class Ephemeris:
     """
     Wrapper around pyswisseph for easy planetary position calculations.
@@ -23,119 +107,54 @@ class Ephemeris:
         """Convert datetime to Julian Day."""
         if dt.tzinfo:
             dt = dt.astimezone(pytz.utc)
+        return Ephemeris._get_julian_day_utc(dt)
+
+    @staticmethod
+    def _get_julian_day_utc(dt: datetime) -> float:
+        """Convert a datetime already in UTC to Julian Day, skipping timezone handling."""
         return swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute/60.0 + dt.second/3600.0)
 
     @staticmethod
     def get_planetary_positions(jd: float):
         """
-        Get geocentric longitude of Sun and Moon.
-        Returns (sun_long, moon_long) in degrees.
+        Get geocentric longitude and daily motion of Sun and Moon.
+        Returns (sun_long, moon_long, sun_speed, moon_speed) in degrees and degrees/day.
         """
-        flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL
-        
-        try:
-            # Sun
-            sun_res = swe.calc_ut(jd, swe.SUN, flags)
-            sun_long = sun_res[0][0]
-            
-            # Moon
-            moon_res = swe.calc_ut(jd, swe.MOON, flags)
-            moon_long = moon_res[0][0]
-        except swe.Error:
-            # Fallback to Moshier Ephemeris if Swiss Ephemeris files are missing
-            flags = swe.FLG_MOSEPH | swe.FLG_SIDEREAL
-            sun_res = swe.calc_ut(jd, swe.SUN, flags)
-            sun_long = sun_res[0][0]
-            moon_res = swe.calc_ut(jd, swe.MOON, flags)
-            moon_long = moon_res[0][0]
-        
-        return sun_long, moon_long
+        return _planetary_positions(round(jd, 8))
+
+    @staticmethod
+    def get_planetary_positions_array(jd_array):
+        """
+        Array version of get_planetary_positions (requires numpy).
+        Still one (cached) ephemeris lookup per JD from Python; the results are
+        collected straight into a float64 buffer for elementwise use.
+        Returns (sun_long, moon_long, sun_speed, moon_speed) as float64 arrays.
+        """
+        np = _require_numpy()
+        jd_array = np.asarray(jd_array, dtype=np.float64)
+        n = jd_array.size
+        flat = np.fromiter(
+            (x for jd in jd_array.ravel().tolist() for x in _planetary_positions(round(jd, 8))),
+            dtype=np.float64, count=4 * n
+        )
+        sun, moon, sun_speed, moon_speed = flat.reshape(n, 4).T
+        shape = jd_array.shape
+        return (np.ascontiguousarray(sun).reshape(shape), np.ascontiguousarray(moon).reshape(shape),
+                np.ascontiguousarray(sun_speed).reshape(shape), np.ascontiguousarray(moon_speed).reshape(shape))
+
+    @staticmethod
+    def get_sun_longitude(jd: float):
+        """
+        Get geocentric longitude and daily motion of the Sun only.
+        Returns (sun_long, sun_speed) in degrees and degrees/day.
+        """
+        return _sun_longitude(round(jd, 8))
 
     @staticmethod
     def get_sunrise_sunset(dt: datetime, lat: float, lon: float):
         """
-        Calculate sunrise and sunset for a given date and location using iterative search.
+        Calculate sunrise and sunset for a given date and location using swe.rise_trans.
         Returns (sunrise_dt, sunset_dt) as datetime objects or None.
+        Results are cached per calendar date of dt and location (rounded to ~11 m).
         """
-        # Target altitude for sunrise/sunset (center of disc) with refraction
-        # Standard refraction is 34 arcmin = 0.5667 deg.
-        # Sun semi-diameter is ~16 arcmin = 0.2667 deg.
-        # Upper limb rise: -0.8333 deg (-50 arcmin).
-        TARGET_ALT = -0.8333
-        
-        def get_sun_alt(t_jd):
-            # Calculate Topocentric position
-            swe.set_topo(lon, lat, 0)
-            flags = swe.FLG_SWIEPH | swe.FLG_EQUATORIAL | swe.FLG_TOPOCTR
-            try:
-                res = swe.calc_ut(t_jd, swe.SUN, flags)
-            except swe.Error:
-                # Fallback to Moshier
-                flags = swe.FLG_MOSEPH | swe.FLG_EQUATORIAL | swe.FLG_TOPOCTR
-                res = swe.calc_ut(t_jd, swe.SUN, flags)
-                
-            # res[0] is (RA, Dec, Dist, SpeedRA, SpeedDec, SpeedDist)
-            ra = res[0][0]
-            dec = res[0][1]
-            
-            import math
-            lat_rad = math.radians(lat)
-            dec_rad = math.radians(dec)
-            
-            # Calculate GST
-            gst = swe.sidtime(t_jd)
-            # Local Sidereal Time (hours)
-            lst = gst + lon / 15.0
-            # Hour Angle (degrees)
-            ha_deg = normalize_degrees(lst * 15.0 - ra)
-            ha_rad = math.radians(ha_deg)
-            
-            sin_alt = math.sin(lat_rad) * math.sin(dec_rad) + math.cos(lat_rad) * math.cos(dec_rad) * math.cos(ha_rad)
-            # Clamp value for asin
-            if sin_alt > 1.0: sin_alt = 1.0
-            if sin_alt < -1.0: sin_alt = -1.0
-            
-            alt_rad = math.asin(sin_alt)
-            return math.degrees(alt_rad)
-
-        def find_event(start_jd, rising=True):
-            # Iterative search
-            t = start_jd
-            for _ in range(10):
-                alt = get_sun_alt(t)
-                diff = alt - TARGET_ALT
-                if abs(diff) < 0.001: # Precision ~1 sec
-                    return t
-                
-                # Correction: 1 deg ~ 4 min = 1/360 days
-                correction = -diff / 360.0 
-                if not rising: correction = -correction 
-                t += correction
-            return t
-
-        # Search for Sunrise around 6 AM
-        midnight = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-        jd_mid = Ephemeris.get_julian_day(midnight)
-        
-        # Approx Sunrise: 6 AM = 0.25 days from midnight
-        rise_guess = jd_mid + 0.25
-        # Approx Sunset: 6 PM = 0.75 days from midnight
-        set_guess = jd_mid + 0.75
-        
-        rise_jd = find_event(rise_guess, rising=True)
-        set_jd = find_event(set_guess, rising=False)
-        
-        sunrise_dt = None
-        sunset_dt = None
-        
-        if rise_jd:
-            y, m, d, h_dec = swe.revjul(rise_jd)
-            h = int(h_dec); mn = int((h_dec - h) * 60); s = int(((h_dec - h) * 60 - mn) * 60)
-            sunrise_dt = datetime(y, m, d, h, mn, s, tzinfo=pytz.utc)
-            
-        if set_jd:
-            y, m, d, h_dec = swe.revjul(set_jd)
-            h = int(h_dec); mn = int((h_dec - h) * 60); s = int(((h_dec - h) * 60 - mn) * 60)
-            sunset_dt = datetime(y, m, d, h, mn, s, tzinfo=pytz.utc)
-            
-        return sunrise_dt, sunset_dt
+        return _sunrise_sunset(dt.toordinal(), round(lat, 4), round(lon, 4))
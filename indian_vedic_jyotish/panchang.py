@@ -1,9 +1,24 @@
 from datetime import datetime, timedelta
 import pytz
-from .core import Ephemeris
-from .utils import TITHIS, NAKSHATRAS, YOGAS, KARANAS_MOVABLE, KARANAS_FIXED, normalize_degrees, format_time
+
+from .core import Ephemeris, _jd_to_datetime, _require_numpy
+from .utils import TITHIS, NAKSHATRAS, YOGAS, KARANAS_MOVABLE, KARANAS_FIXED, format_time
 from .solar import SolarCalendar
 
+# Angular span of each element and its reciprocal, in degrees
+_TITHI_DIV = 12.0
+_NAK_DIV = 360.0 / 27.0
+_YOGA_DIV = _NAK_DIV
+_KARANA_DIV = 6.0
+_TITHI_INV = 1.0 / _TITHI_DIV
+_NAK_INV = 1.0 / _NAK_DIV
+_YOGA_INV = 1.0 / _YOGA_DIV
+_KARANA_INV = 1.0 / _KARANA_DIV
+
+# Karana name for each of the 60 half-tithis of a lunar month:
+# Kimstughna, then the 7 movable karanas 8 times, then Shakuni, Chatushpada, Naga
+_KARANA_BY_IDX = (KARANAS_FIXED[3],) + tuple(KARANAS_MOVABLE[(i - 1) % 7] for i in range(1, 57)) + KARANAS_FIXED[:3]
+
 class Panchang:
     """
     Calculates Panchang data for a specific date and location.
@@ -20,10 +35,12 @@ class Panchang:
         self.dt = dt
         self.lat = lat
         self.lon = lon
-        self.jd = Ephemeris.get_julian_day(dt)
+        # Convert to UTC once; everything below works from the JD
+        self._utc_dt = dt.astimezone(pytz.utc)
+        self.jd = Ephemeris._get_julian_day_utc(self._utc_dt)
         
         # Calculate Planetary Positions
-        self.sun_long, self.moon_long = Ephemeris.get_planetary_positions(self.jd)
+        self.sun_long, self.moon_long, self.sun_speed, self.moon_speed = Ephemeris.get_planetary_positions(self.jd)
         
         # Calculate Panchang Elements
         self._calculate_elements()
@@ -35,57 +52,88 @@ class Panchang:
         self._calculate_bengali_date()
 
     def _calculate_elements(self):
+        sun, moon = self.sun_long, self.moon_long
+        
         # Tithi
-        diff = normalize_degrees(self.moon_long - self.sun_long)
-        self.tithi_index = int(diff / 12)
-        self.tithi_name = TITHIS[self.tithi_index % 30]
-        self.tithi_end = self._calculate_end_time(self._get_tithi_index, self.tithi_index)
+        self.tithi_index = ti = self._get_tithi_index(sun, moon)
+        self.tithi_name = TITHIS[ti % 30]
         
         # Nakshatra
-        self.nakshatra_index = int(self.moon_long / (360 / 27))
-        self.nakshatra_name = NAKSHATRAS[self.nakshatra_index % 27]
-        self.nakshatra_end = self._calculate_end_time(self._get_nakshatra_index, self.nakshatra_index)
+        self.nakshatra_index = ni = self._get_nakshatra_index(sun, moon)
+        self.nakshatra_name = NAKSHATRAS[ni % 27]
         
         # Yoga
-        total = normalize_degrees(self.sun_long + self.moon_long)
-        self.yoga_index = int(total / (360 / 27))
-        self.yoga_name = YOGAS[self.yoga_index % 27]
-        self.yoga_end = self._calculate_end_time(self._get_yoga_index, self.yoga_index)
+        self.yoga_index = yi = self._get_yoga_index(sun, moon)
+        self.yoga_name = YOGAS[yi % 27]
+        
+        self.tithi_end, self.nakshatra_end, self.yoga_end = self._calculate_end_times()
         
         # Karana
-        karana_idx = int(diff / 6)
-        if karana_idx == 0:
-            self.karana_name = "Kimstughna"
-        elif karana_idx >= 57:
-            if karana_idx == 57: self.karana_name = "Shakuni"
-            elif karana_idx == 58: self.karana_name = "Chatushpada"
-            else: self.karana_name = "Naga"
-        else:
-            self.karana_name = KARANAS_MOVABLE[(karana_idx - 1) % 7]
-
-    def _get_tithi_index(self, sun, moon):
-        return int(normalize_degrees(moon - sun) / 12)
-
-    def _get_nakshatra_index(self, sun, moon):
-        return int(moon / (360 / 27))
-
-    def _get_yoga_index(self, sun, moon):
-        return int(normalize_degrees(sun + moon) / (360 / 27))
-
-    def _calculate_end_time(self, check_func, current_index):
-        """Find the end time of the current element."""
-        # Iterative search forward
-        step = 15 # minutes
-        dt = self.dt
-        for _ in range(int(30 * 60 / step)): # Search up to 30 hours
-            dt += timedelta(minutes=step)
-            jd = Ephemeris.get_julian_day(dt)
-            s, m = Ephemeris.get_planetary_positions(jd)
-            if check_func(s, m) != current_index:
-                # Refine search (binary search could be better but linear step back is fine)
-                # Let's just return this approximate time for now
-                return dt
-        return None
+        self.karana_name = _KARANA_BY_IDX[int((moon - sun) % 360.0 * _KARANA_INV) % 60]
+
+    @staticmethod
+    def _get_tithi_index(sun, moon):
+        return int((moon - sun) % 360.0 * _TITHI_INV)
+
+    @staticmethod
+    def _get_nakshatra_index(sun, moon):
+        return int(moon * _NAK_INV)
+
+    @staticmethod
+    def _get_yoga_index(sun, moon):
+        return int((sun + moon) % 360.0 * _YOGA_INV)
+
+    # Longitude and daily motion of each element; the 360 wrap around is
+    # handled by the boundary offset in _calculate_end_times.
+    @staticmethod
+    def _get_tithi_motion(s, m, s_speed, m_speed):
+        return m - s, m_speed - s_speed
+
+    @staticmethod
+    def _get_nakshatra_motion(s, m, s_speed, m_speed):
+        return m, m_speed
+
+    @staticmethod
+    def _get_yoga_motion(s, m, s_speed, m_speed):
+        return s + m, s_speed + m_speed
+
+    def _calculate_end_times(self):
+        """
+        Find the end times of Tithi, Nakshatra and Yoga in one loop.
+        Each element ends when its longitude reaches (index + 1) * span.
+        Every pass takes a Newton step for each unresolved element, using the daily
+        motion of Sun and Moon as the derivative. Only the first step shares an
+        ephemeris lookup (the cached positions for self.jd); later steps are per element.
+        Returns (tithi_end, nakshatra_end, yoga_end).
+        """
+        get_positions = Ephemeris.get_planetary_positions
+        elements = (
+            (self._get_tithi_motion, (self.tithi_index + 1) * _TITHI_DIV),
+            (self._get_nakshatra_motion, (self.nakshatra_index + 1) * _NAK_DIV),
+            (self._get_yoga_motion, (self.yoga_index + 1) * _YOGA_DIV)
+        )
+        jds = [self.jd, self.jd, self.jd]
+        pending = (0, 1, 2)
+        for _ in range(6):
+            unresolved = []
+            for k in pending:
+                motion, target = elements[k]
+                longitude, speed = motion(*get_positions(jds[k]))
+                # Signed distance to the boundary, handling the 360 wrap around
+                offset = (longitude - target + 180.0) % 360.0 - 180.0
+                jds[k] -= offset / speed
+                if abs(offset) >= 1e-5: # Precision ~0.1 sec
+                    unresolved.append(k)
+            pending = unresolved
+            if not pending:
+                break
+        
+        # Elements never last longer than ~27 hours
+        tz = self.dt.tzinfo
+        return tuple(
+            None if jd - self.jd > 30 / 24.0 else _jd_to_datetime(jd, tz)
+            for jd in jds
+        )
 
     def _calculate_timings(self):
         self.sunrise, self.sunset = Ephemeris.get_sunrise_sunset(self.dt, self.lat, self.lon)
@@ -126,6 +174,40 @@ class Panchang:
         self.bengali_month = month
         self.bengali_year = year
 
+    @staticmethod
+    def batch(dt_array):
+        """
+        Calculate Tithi, Nakshatra, Yoga, Karana and Bengali date for many datetimes at once
+        (requires numpy). End times and timings are not computed.
+        dt_array: iterable of datetime objects (naive ones are assumed UTC)
+        Returns a dict of index arrays and name lists, in input order.
+        """
+        np = _require_numpy()
+        dts = [dt if dt.tzinfo else dt.replace(tzinfo=pytz.utc) for dt in dt_array]
+        jds = np.fromiter((Ephemeris.get_julian_day(dt) for dt in dts), dtype=np.float64, count=len(dts))
+        sun, moon, _, _ = Ephemeris.get_planetary_positions_array(jds)
+        
+        diff = (moon - sun) % 360.0
+        tithi_idx = (diff * _TITHI_INV).astype(np.int64)
+        nakshatra_idx = (moon * _NAK_INV).astype(np.int64)
+        yoga_idx = ((sun + moon) % 360.0 * _YOGA_INV).astype(np.int64)
+        karana_idx = (diff * _KARANA_INV).astype(np.int64)
+        
+        bengali = [SolarCalendar.get_bengali_date(dt) for dt in dts]
+        
+        return {
+            "tithi_index": tithi_idx,
+            "nakshatra_index": nakshatra_idx,
+            "yoga_index": yoga_idx,
+            "tithi": [TITHIS[i % 30] for i in tithi_idx.tolist()],
+            "nakshatra": [NAKSHATRAS[i % 27] for i in nakshatra_idx.tolist()],
+            "yoga": [YOGAS[i % 27] for i in yoga_idx.tolist()],
+            "karan": [_KARANA_BY_IDX[i % 60] for i in karana_idx.tolist()],
+            "bengali_date": [day for day, _, _ in bengali],
+            "bengali_month": [month for _, month, _ in bengali],
+            "bengali_year": [year for _, _, year in bengali]
+        }
+
     def to_dict(self):
         return {
             "tithi": {"name": self.tithi_name, "end": format_time(self.tithi_end)},
@@ -1,14 +1,27 @@
+import math
 import swisseph as swe
-from datetime import datetime, timedelta
+from datetime import datetime
+from bisect import bisect_left
 import pytz
 from .core import Ephemeris
 from .utils import BENGALI_MONTHS
 
+_IST = pytz.timezone('Asia/Kolkata')
+
+_SOLCROSS_FLAGS = swe.FLG_SWIEPH | swe.FLG_SIDEREAL
+
+def _cache_clear():
+    """Drop the memoized Sankranti tables. Use indian_vedic_jyotish._cache_clear() to clear everything."""
+    SolarCalendar._sankranti_cache.clear()
+
 class SolarCalendar:
     """
     Handles calculations for the Bengali Solar Calendar (Drik Siddhanta).
     """
     
+    # Gregorian year -> Sankranti Julian Days, see _sankranti_table
+    _sankranti_cache = {}
+    
     @staticmethod
     def get_sankranti_time(year: int, month: int, target_sign: int) -> float:
         """
@@ -37,151 +50,73 @@ class SolarCalendar:
         pass
 
     @staticmethod
-    def get_bengali_date(dt: datetime):
+    def _find_ingress(jd: float, sign_start_deg: float) -> float:
         """
-        Calculate Bengali Date, Month, and Year for a given datetime.
-        Returns (day, month_name, year).
+        Find the Julian Day when Sun last crossed sign_start_deg before jd.
+        The crossing must lie within 32 days of jd.
         """
-        jd = Ephemeris.get_julian_day(dt)
-        sun_long, _ = Ephemeris.get_planetary_positions(jd)
-        
-        # Current Solar Month Index (0 = Aries/Boishakh, 1 = Taurus/Jyoishtho...)
-        # Sun Longitude 0-30 is Aries.
-        month_index = int(sun_long / 30)
-        
-        # We need to find the EXACT time Sun entered this sign (Sankranti).
-        # We search backward.
-        
-        # Define a function to get Sun's longitude difference from the sign start
-        def get_sun_offset(t_jd, sign_start_deg):
-            s_long, _ = Ephemeris.get_planetary_positions(t_jd)
+        try:
+            # First crossing after the start of the search window
+            return swe.solcross_ut(sign_start_deg, jd - 32.0, _SOLCROSS_FLAGS)
+        except (AttributeError, swe.Error):
+            # Older bindings lack solcross_ut; fall back to Newton's method below
+            pass
+        
+        # Newton's method on the Sun's longitude: its daily motion (~0.9856 deg/day)
+        # barely changes over a month, so 3-4 iterations reach sub-second precision.
+        t_jd = jd
+        for _ in range(5):
+            s_long, s_speed = Ephemeris.get_sun_longitude(t_jd)
             # Handle 360 wrap around for Pisces->Aries
             diff = s_long - sign_start_deg
             if diff < -180: diff += 360
             if diff > 180: diff -= 360
-            return diff
+            t_jd -= diff / s_speed
+            if abs(diff) < 1e-6: # Precision ~0.1 sec
+                break
+        return t_jd
 
-        sign_start_deg = month_index * 30.0
-        
-        # Use simple bisection or linear search to find ingress time (offset = 0)
-        # Start from current time and go back up to 32 days.
-        
-        # Initial bracket
-        t1 = jd
-        t0 = jd - 32.0 
-        
-        # Refine t0 to ensure it's before ingress
-        # If we are in the middle of the month, -32 days should definitely be in previous sign.
-        
-        # Root finding (when offset = 0)
-        # Using swe.solcross is better/faster if available, but let's stick to bisection for simplicity/robustness without complex C-api usage if not familiar.
-        # Actually swe.solcross is not standard python binding?
-        # Let's use bisection.
-        
-        lower = t0
-        upper = t1
-        
-        # Find exact ingress JD
-        ingress_jd = None
-        for _ in range(20): # 20 iterations is enough precision
-            mid = (lower + upper) / 2
-            off = get_sun_offset(mid, sign_start_deg)
-            if off > 0:
-                upper = mid
-            else:
-                lower = mid
-        
-        ingress_jd = upper
-        
-        # Calculate Civil Day 1 of the month
-        # Rule: If Sankranti is before Midnight (IST?), next day is Day 1.
-        # If after Midnight, day after next is Day 1.
-        # We need to convert ingress_jd to IST datetime.
-        
-        # Convert JD to UTC datetime
-        y, m, d, h_dec = swe.revjul(ingress_jd)
-        h = int(h_dec)
-        mn = int((h_dec - h) * 60)
-        s = int(((h_dec - h) * 60 - mn) * 60)
-        ingress_utc = datetime(y, m, d, h, mn, s, tzinfo=pytz.utc)
-        
-        # Convert to IST
-        ist = pytz.timezone('Asia/Kolkata')
-        ingress_ist = ingress_utc.astimezone(ist)
-        
-        # Determine Day 1 Date
-        # If ingress is between Sunrise and Midnight -> Next Day is Day 1
-        # If ingress is between Midnight and Sunrise -> That Day is Day 1 (because it's technically "tomorrow" relative to previous sunrise?)
-        # Let's use the standard West Bengal rule:
-        # "If Sankranti occurs between sunrise and midnight, the month begins on the following day."
-        # "If Sankranti occurs after midnight, the month begins on the day after that." (Wait, this implies +2 days?)
-        
-        # Let's simplify: Day 1 is usually the day AFTER Sankranti day.
-        # Sankranti Day = Day 0 (Last day of previous month).
-        
-        # Let's find the date of Sankranti in IST.
-        sankranti_date = ingress_ist.date()
-        
-        # Day 1 is sankranti_date + 1 day
-        day_1_date = sankranti_date + timedelta(days=1)
-        
-        # Check if Sankranti was "late" (after midnight).
-        # In Bengali convention, day starts at Sunrise.
-        # If Sankranti is at 2 AM on 15th, it is technically "late night of 14th".
-        # So 15th is Day 1?
-        # No, let's stick to the standard Drik Siddhanta convention used by Visuddha Siddhanta Panjika.
-        # Rule: If Sankranti is before midnight, next day is 1st.
-        # If Sankranti is after midnight, day after next is 1st.
+    @staticmethod
+    def _sankranti_table(year: int):
+        """
+        Julian Days of the 12 Sankrantis in Gregorian year `year`, in calendar order.
+        Sankranti falls mid-month: Capricorn in January, ..., Aries in April, ..., Sagittarius in December,
+        so entry i (month i + 1) is the ingress into sign (i - 3) % 12.
+        Built once per year and kept in _sankranti_cache.
+        """
+        table = SolarCalendar._sankranti_cache.get(year)
+        if table is None:
+            table = [
+                SolarCalendar._find_ingress(swe.julday(year, month, 28, 0.0), ((month - 4) % 12) * 30.0)
+                for month in range(1, 13)
+            ]
+            SolarCalendar._sankranti_cache[year] = table
+        return table
+
+    @staticmethod
+    def get_bengali_date(dt: datetime):
+        """
+        Calculate Bengali Date, Month, and Year for a given datetime.
+        Returns (day, month_name, year).
+        """
+        # The civil date in IST decides the Bengali date.
+        current_date = dt.astimezone(_IST).date()
         
-        # Check if ingress_ist is after 00:00 and before Sunrise? 
-        # Or just check hour.
-        # Midnight is 00:00 IST.
+        # Day 1 of a month is the civil (IST) day after its Sankranti, so the current
+        # month began with the last Sankranti before 00:00 IST today.
+        day_start_jd = Ephemeris.get_julian_day(_IST.localize(datetime(current_date.year, current_date.month, current_date.day)))
         
-        # Actually, let's use the simpler rule for now: Day 1 is the day after the civil day of Sankranti.
-        # We calculate the difference in days between current dt and day_1_date.
+        # Last year's December Sankranti covers the start of January
+        table = SolarCalendar._sankranti_table(current_date.year - 1)[-1:] + SolarCalendar._sankranti_table(current_date.year)
+        i = bisect_left(table, day_start_jd) - 1
         
-        current_date = dt.astimezone(ist).date()
-        day_of_month = (current_date - day_1_date).days + 1
+        # Solar Month Index (0 = Aries/Boishakh, 1 = Taurus/Jyoishtho...); table[0] is Sagittarius
+        month_index = (i - 4) % 12
         
-        # If day_of_month <= 0, it means we are in the previous month!
-        # We need to handle this.
-        if day_of_month <= 0:
-            # We are in the previous month.
-            # Recursive call? Or just subtract 1 from month_index and recalculate.
-            # Better to handle it iteratively but recursion is cleaner here for one step.
-            # But wait, month_index was calculated from current sun position.
-            # If we are in the first few days of the solar month, sun_long is 0..30.
-            # So month_index is correct for the *solar* month.
-            # But the *civil* month might lag behind by 1-2 days.
-            # So if day_of_month <= 0, it means we are still in the *previous* civil month.
-            # So we should use (month_index - 1).
-            
-            prev_month_index = (month_index - 1) % 12
-            # Recalculate ingress for prev month
-            sign_start_deg = prev_month_index * 30.0
-            
-            # Search again
-            lower = jd - 65.0
-            upper = jd - 15.0 # Ingress must be further back
-             
-            for _ in range(20):
-                mid = (lower + upper) / 2
-                off = get_sun_offset(mid, sign_start_deg)
-                if off > 0: upper = mid
-                else: lower = mid
-            
-            ingress_jd = upper
-            
-            # Recalculate Day 1
-            y, m, d, h_dec = swe.revjul(ingress_jd)
-            h = int(h_dec); mn = int((h_dec - h) * 60); s = int(((h_dec - h) * 60 - mn) * 60)
-            ingress_ist = datetime(y, m, d, h, mn, s, tzinfo=pytz.utc).astimezone(ist)
-            
-            sankranti_date = ingress_ist.date()
-            day_1_date = sankranti_date + timedelta(days=1)
-            
-            day_of_month = (current_date - day_1_date).days + 1
-            month_index = prev_month_index
+        # Sankranti Day = Day 0, so Day 1 is the next civil day: count the IST
+        # midnights from the Sankranti up to today's. No rounding, so a Sankranti
+        # just before midnight still belongs to the previous civil day.
+        day_of_month = math.ceil(day_start_jd - table[i])
 
         # Bengali Year (Bangabda)
         # April 14, 2024 is start of 1431.
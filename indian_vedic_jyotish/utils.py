@@ -1,39 +1,39 @@
 from datetime import datetime
 
 # Constants
-TITHIS = [
+TITHIS = (
     "Shukla Pratipada", "Shukla Dwitiya", "Shukla Tritiya", "Shukla Chaturthi", "Shukla Panchami",
     "Shukla Shashti", "Shukla Saptami", "Shukla Ashtami", "Shukla Navami", "Shukla Dashami",
     "Shukla Ekadashi", "Shukla Dwadashi", "Shukla Trayodashi", "Shukla Chaturdashi", "Purnima",
     "Krishna Pratipada", "Krishna Dwitiya", "Krishna Tritiya", "Krishna Chaturthi", "Krishna Panchami",
     "Krishna Shashti", "Krishna Saptami", "Krishna Ashtami", "Krishna Navami", "Krishna Dashami",
     "Krishna Ekadashi", "Krishna Dwadashi", "Krishna Trayodashi", "Krishna Chaturdashi", "Amavasya"
-]
+)
 
-NAKSHATRAS = [
+NAKSHATRAS = (
     "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashirsha", "Ardra", "Punarvasu", "Pushya", "Ashlesha",
     "Magha", "Purva Phalguni", "Uttara Phalguni", "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha",
     "Jyeshtha", "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
     "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
-]
+)
 
-YOGAS = [
+YOGAS = (
     "Vishkumbha", "Priti", "Ayushman", "Saubhagya", "Sobhana", "Atiganda", "Sukarma", "Dhriti", "Shula",
     "Ganda", "Vriddhi", "Dhruva", "Vyaghata", "Harshana", "Vajra", "Siddhi", "Vyatipata", "Variyan",
     "Parigha", "Shiva", "Siddha", "Sadhya", "Shubha", "Shukla", "Brahma", "Indra", "Vaidhriti"
-]
+)
 
-KARANAS_MOVABLE = ["Bava", "Balava", "Kaulava", "Taitila", "Gara", "Vanija", "Vishti (Bhadra)"]
-KARANAS_FIXED = ["Shakuni", "Chatushpada", "Naga", "Kimstughna"]
+KARANAS_MOVABLE = ("Bava", "Balava", "Kaulava", "Taitila", "Gara", "Vanija", "Vishti (Bhadra)")
+KARANAS_FIXED = ("Shakuni", "Chatushpada", "Naga", "Kimstughna")
 
-BENGALI_MONTHS = [
+BENGALI_MONTHS = (
     "Boishakh", "Jyoishtho", "Asharh", "Srabon", "Bhadro", "Ashwin", 
     "Kartik", "Agrahayon", "Poush", "Magh", "Falgun", "Chaitra"
-]
+)
 
 def normalize_degrees(deg):
-    """Normalize degrees to 0-360 range."""
-    return deg % 360
+    """Normalize degrees to 0-360 range. Also works elementwise on numpy arrays."""
+    return deg % 360.0
 
 def format_time(dt: datetime) -> str:
     """Format datetime to ISO string or empty string if None."""
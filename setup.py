@@ -11,6 +11,9 @@ setup(
         "pyswisseph>=2.10.3.2",
         "pytz>=2023.3",
     ],
+    extras_require={
+        "batch": ["numpy>=1.17"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
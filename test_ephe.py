@@ -23,5 +23,43 @@ def test_ephe():
     except Exception as e:
         print(f"Calculation (MOSEPH) Failed: {e}")
 
+def test_sunrise_before_sunset():
+    # Naive (UTC) input at the default Kolkata location: sunrise falls before
+    # 00:00 UTC in June, and must still be paired with the same day's sunset.
+    from datetime import datetime
+    from indian_vedic_jyotish import Panchang
+    
+    p = Panchang(datetime(2024, 6, 1, 3))
+    print(f"Sunrise: {p.sunrise}, Sunset: {p.sunset}")
+    assert p.sunset > p.sunrise
+    assert p.timings["rahu_end"] > p.timings["rahu_start"]
+
+def test_batch_matches_panchang():
+    # Panchang.batch (requires numpy) must agree with the scalar Panchang per date
+    from datetime import datetime, timedelta
+    from indian_vedic_jyotish import Panchang
+    
+    days = [datetime(2024, 4, 1, 6) + timedelta(days=i) for i in range(40)]
+    res = Panchang.batch(days)
+    for i, d in enumerate(days):
+        p = Panchang(d)
+        assert res["tithi_index"][i] == p.tithi_index
+        assert res["nakshatra_index"][i] == p.nakshatra_index
+        assert res["yoga_index"][i] == p.yoga_index
+        assert res["tithi"][i] == p.tithi_name
+        assert res["nakshatra"][i] == p.nakshatra_name
+        assert res["yoga"][i] == p.yoga_name
+        assert res["karan"][i] == p.karana_name
+        assert res["bengali_date"][i] == p.bengali_date
+        assert res["bengali_month"][i] == p.bengali_month
+        assert res["bengali_year"][i] == p.bengali_year
+    print(f"Batch: {len(days)} days match Panchang")
+    
+    # Empty input gives empty results
+    empty = Panchang.batch([])
+    assert all(len(v) == 0 for v in empty.values())
+
 if __name__ == "__main__":
     test_ephe()
+    test_sunrise_before_sunset()
+    test_batch_matches_panchang()